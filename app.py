@@ -4,9 +4,9 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+import os
 from datetime import datetime
 import warnings
-warnings.filterwarnings('ignore')
 
 # 페이지 설정
 st.set_page_config(
@@ -53,43 +53,121 @@ st.markdown("""
         margin: 1rem 0;
         border-radius: 0 8px 8px 0;
     }
-    .chart-container {
-        background-color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        margin: 1rem 0;
-    }
 </style>
 """, unsafe_allow_html=True)
 
+# CSV를 한 번만 파싱해 Parquet으로 저장하고 이후에는 Parquet에서 읽는 함수
+def load_table(csv_path, date_col, dtypes):
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    
+    # Parquet이 없거나 원본 CSV가 더 최신이면 다시 변환
+    if (not os.path.exists(parquet_path)
+            or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path)):
+        df = pd.read_csv(csv_path, dtype=dtypes)
+        # 날짜는 datetime으로 변환해 저장하므로 로딩 후 재변환이 필요 없음
+        # 형식 추론 경고는 날짜 변환에만 한정해서 무시
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            df[date_col] = pd.to_datetime(df[date_col], errors='coerce')
+        # 임시 파일에 먼저 쓰고 교체해 쓰기 도중 실패해도 깨진 Parquet이 남지 않도록 함
+        tmp_path = parquet_path + '.tmp'
+        try:
+            df.to_parquet(tmp_path, engine='pyarrow', compression='snappy', index=False)
+            os.replace(tmp_path, parquet_path)
+        except OSError:
+            # 디렉터리에 쓸 수 없으면 캐시 없이 이미 파싱한 CSV 결과를 그대로 사용
+            return df
+    
+    # 이전 실행에서 만든 Parquet의 dtype이 현재 설정과 다를 수 있으므로 읽은 뒤 다시 적용
+    return pd.read_parquet(parquet_path, engine='pyarrow').astype(dtypes)
+
 # 데이터 로딩 및 전처리 함수
 @st.cache_data
 def load_and_process_data():
     try:
         # 데이터 로딩
-        kobis_df = pd.read_csv('kobis_weekly_2013_2025_enriched.csv')
-        tmdb_df = pd.read_csv('tmdb_global_top_2014_2024_N100_with_genres.csv')
+        kobis_df = load_table('kobis_weekly_2013_2025_enriched.csv', 'openDt', {
+            'movieCd': str, 'movieNm': str,
+            'year': 'int16', 'audiCnt': 'int32', 'scrnCnt': 'int16'
+        })
+        tmdb_df = load_table('tmdb_global_top_2014_2024_N100_with_genres.csv', 'release_date', {
+            'title': str,
+            'year': 'int16', 'vote_average': 'float32', 'vote_count': 'int32', 'popularity': 'float32'
+        })
+        
+        # 누적 관객수/매출액은 범위가 넓으므로 값에 맞춰 가능한 가장 작은 정수형으로 축소
+        kobis_df['audiAcc'] = pd.to_numeric(kobis_df['audiAcc'], downcast='integer')
+        kobis_df['salesAmt'] = pd.to_numeric(kobis_df['salesAmt'], downcast='integer')
         
-        # 현재 시점 기준으로 유효한 데이터만 필터링
+        # 문자열 컬럼은 Arrow 기반 문자열 타입으로 변환 (str 연산/groupby를 Arrow 커널에서 처리)
+        kobis_df = kobis_df.astype({'movieNm': 'string[pyarrow]', 'genres': 'string[pyarrow]'})
+        tmdb_df = tmdb_df.astype({'title': 'string[pyarrow]'})
+        # 언어 코드는 종류가 적으므로 범주형으로 변환해 groupby가 정수 코드를 키로 사용하도록 함
+        tmdb_df['original_language'] = tmdb_df['original_language'].astype('category')
+        
+        # 현재 시점 기준 유효 데이터 필터링과 이상치 제거를 하나의 마스크로 처리
         current_year = 2024
-        kobis_df = kobis_df[kobis_df['year'] <= current_year]
-        tmdb_df = tmdb_df[tmdb_df['year'] <= current_year]
+        kobis_df = kobis_df.loc[
+            (kobis_df['year'] <= current_year)
+            & (kobis_df['audiCnt'] >= 0)
+            & (kobis_df['salesAmt'] >= 0)
+        ]
+        tmdb_df = tmdb_df.loc[
+            (tmdb_df['year'] <= current_year)
+            & (tmdb_df['vote_average'] >= 0)
+            & (tmdb_df['vote_average'] <= 10)
+        ]
         
-        # 날짜 전처리
-        kobis_df['openDt'] = pd.to_datetime(kobis_df['openDt'], errors='coerce')
-        tmdb_df['release_date'] = pd.to_datetime(tmdb_df['release_date'], errors='coerce')
+        # 연도 구간을 searchsorted로 잘라낼 수 있도록 연도순으로 정렬
+        kobis_df = kobis_df.sort_values('year', kind='stable').reset_index(drop=True)
+        tmdb_df = tmdb_df.sort_values('year', kind='stable').reset_index(drop=True)
         
-        # 이상치 제거
-        kobis_df = kobis_df[kobis_df['audiCnt'] >= 0]
-        kobis_df = kobis_df[kobis_df['salesAmt'] >= 0]
-        tmdb_df = tmdb_df[(tmdb_df['vote_average'] >= 0) & (tmdb_df['vote_average'] <= 10)]
+        # 개봉 월은 한 번만 추출해 int8로 보관 (개봉일이 없으면 0)
+        kobis_df['month'] = kobis_df['openDt'].dt.month.fillna(0).astype(np.int8)
         
         return kobis_df, tmdb_df
     except Exception as e:
         st.error(f"데이터 로딩 오류: {e}")
         return None, None
 
+def get_recent_data(kobis_df, tmdb_df, years):
+    # 데이터가 연도순으로 정렬되어 있으므로 (시작, 끝) 연도 구간을 이진 탐색으로 슬라이싱
+    # 슬라이스 비용이 작아 캐시하지 않음 (st.cache_data는 재실행마다 결과를 복사함)
+    start_year, end_year = years
+    lo, hi = kobis_df['year'].searchsorted([start_year, end_year + 1])
+    kobis_recent = kobis_df.iloc[lo:hi]
+    lo, hi = tmdb_df['year'].searchsorted([start_year, end_year + 1])
+    tmdb_recent = tmdb_df.iloc[lo:hi]
+    return kobis_recent, tmdb_recent
+
+@st.cache_data
+def summarize(df, kind):
+    # 탭 전환마다 반복되던 스칼라 집계를 한 번만 계산 (프레임 내용을 캐시 키로 사용하므로 데이터가 바뀌면 다시 계산)
+    summary = {'count': len(df)}
+    if df.empty:
+        return summary
+    
+    summary['year_min'] = int(df['year'].min())
+    summary['year_max'] = int(df['year'].max())
+    
+    if kind == 'kobis':
+        # 한 번의 집계로 합계/최댓값 위치/평균을 함께 계산
+        stats = df.agg({'audiAcc': ['sum', 'idxmax'], 'scrnCnt': 'mean'})
+        top_movie = df.loc[int(stats.loc['idxmax', 'audiAcc'])]
+        summary['total_audience'] = float(stats.loc['sum', 'audiAcc'])
+        summary['avg_screen'] = float(stats.loc['mean', 'scrnCnt'])
+        summary['top_movie_name'] = top_movie['movieNm']
+        summary['top_movie_audience'] = float(top_movie['audiAcc'])
+    elif kind == 'tmdb':
+        summary['top_rating'] = float(df['vote_average'].max())
+        summary['avg_rating'] = float(df['vote_average'].mean())
+        summary['avg_popularity'] = float(df['popularity'].mean())
+        summary['high_rated_count'] = int((df['vote_average'] >= 8.0).sum())
+        if 'original_language' in df.columns:
+            summary['language_count'] = int(df['original_language'].nunique())
+    
+    return summary
+
 def create_metric_card(title, value, subtitle=""):
     return f"""
     <div class="metric-container">
@@ -99,6 +177,73 @@ def create_metric_card(title, value, subtitle=""):
     </div>
     """
 
+def top_n_rows(df, col, n=10):
+    # 전체 정렬 대신 부분 정렬로 상위 n개만 골라 정렬
+    # 결측치 행은 항상 제외 (값이 n개보다 적을 때 NaN 행으로 채우는 nlargest와 의도적으로 다름)
+    values = df[col].to_numpy(dtype=np.float64)
+    candidates = np.flatnonzero(~np.isnan(values))
+    if len(candidates) > n:
+        # n번째 값과 같은 동점 행까지 모두 남긴 뒤 위치 순으로 자르므로 nlargest(keep='first')와 동일
+        threshold = np.partition(values[candidates], -n)[-n]
+        candidates = candidates[values[candidates] >= threshold]
+    order = np.argsort(-values[candidates], kind='stable')[:n]
+    return df.iloc[candidates[order]]
+
+# 차트 생성 함수 (집계 결과가 같으면 같은 Figure 객체를 재사용, st.plotly_chart는 Figure를 변경하지 않음)
+@st.cache_resource
+def build_yearly_fig(yearly_audience):
+    fig = px.bar(yearly_audience, x='year', y='audiCnt',
+                title="연도별 총 관객수",
+                color='audiCnt',
+                color_continuous_scale='Viridis')
+    fig.update_layout(
+        xaxis_title="연도",
+        yaxis_title="총 관객수 (명)",
+        showlegend=False,
+        height=400,
+        uirevision='yearly'
+    )
+    return fig
+
+@st.cache_resource
+def build_monthly_fig(monthly_releases):
+    # 선 그래프는 WebGL(scattergl)로 렌더링
+    fig = go.Figure(go.Scattergl(x=monthly_releases['month_name'], y=monthly_releases['count'],
+                                 mode='lines+markers'))
+    fig.update_layout(
+        title="월별 영화 개봉 수",
+        xaxis_title="월",
+        yaxis_title="개봉 영화 수",
+        height=400,
+        uirevision='monthly'
+    )
+    return fig
+
+@st.cache_resource
+def build_audience_pie(audience_counts, audience_ranges):
+    fig = px.pie(values=audience_counts, names=audience_ranges,
+                title="관객수별 영화 분포")
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@st.cache_resource
+def build_genre_fig(genre_summary):
+    fig = px.bar(genre_summary, x='genre', y='총관객수',
+                title="장르별 총 관객수",
+                color='총관객수',
+                color_continuous_scale='Reds')
+    fig.update_layout(xaxis_title="장르", yaxis_title="총 관객수", uirevision='genre')
+    return fig
+
+@st.cache_resource
+def build_language_fig(lang_analysis):
+    fig = px.bar(lang_analysis, x='언어', y='영화수',
+                title="언어별 영화 제작 수",
+                color='평균평점',
+                color_continuous_scale='Blues')
+    fig.update_layout(uirevision='language')
+    return fig
+
 def main():
     st.markdown('<h1 class="main-header">🎬 영화 흥행 분석 대시보드</h1>', unsafe_allow_html=True)
     
@@ -110,9 +255,10 @@ def main():
         st.stop()
     
     # 기본 필터링 (최근 3년)
-    recent_years = [2022, 2023, 2024]
-    kobis_recent = kobis_df[kobis_df['year'].isin(recent_years)]
-    tmdb_recent = tmdb_df[tmdb_df['year'].isin(recent_years)]
+    recent_years = (2022, 2024)  # (시작 연도, 끝 연도) 포함 구간
+    kobis_recent, tmdb_recent = get_recent_data(kobis_df, tmdb_df, recent_years)
+    kobis_summary = summarize(kobis_recent, 'kobis')
+    tmdb_summary = summarize(tmdb_recent, 'tmdb')
     
     # 탭 생성
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -123,7 +269,7 @@ def main():
     ])
     
     with tab1:
-        show_key_metrics(kobis_recent, tmdb_recent)
+        show_key_metrics(kobis_recent, kobis_summary, tmdb_summary)
     
     with tab2:
         show_korean_analysis(kobis_recent)
@@ -132,19 +278,18 @@ def main():
         show_global_analysis(tmdb_recent)
     
     with tab4:
-        show_insights(kobis_recent, tmdb_recent)
+        show_insights(kobis_recent, tmdb_recent, kobis_summary, tmdb_summary)
 
-def show_key_metrics(kobis_df, tmdb_df):
+def show_key_metrics(kobis_df, kobis_summary, tmdb_summary):
     st.header("🎯 핵심 성과 지표")
     
     # 주요 메트릭
     col1, col2, col3, col4 = st.columns(4)
     
     # 한국 영화 TOP 성과
-    top_korean_movie = kobis_df.loc[kobis_df['audiAcc'].idxmax()] if not kobis_df.empty else None
-    total_audience = kobis_df['audiAcc'].sum() if not kobis_df.empty else 0
-    avg_screen = kobis_df['scrnCnt'].mean() if not kobis_df.empty else 0
-    top_rating = tmdb_df['vote_average'].max() if not tmdb_df.empty else 0
+    total_audience = kobis_summary.get('total_audience', 0)
+    avg_screen = kobis_summary.get('avg_screen', 0)
+    top_rating = tmdb_summary.get('top_rating', 0)
     
     with col1:
         st.markdown(create_metric_card(
@@ -154,11 +299,11 @@ def show_key_metrics(kobis_df, tmdb_df):
         ), unsafe_allow_html=True)
     
     with col2:
-        if top_korean_movie is not None:
+        if 'top_movie_name' in kobis_summary:
             st.markdown(create_metric_card(
                 "최고 흥행작", 
-                f"{top_korean_movie['audiAcc']:,.0f}명",
-                f"{top_korean_movie['movieNm']}"
+                f"{kobis_summary['top_movie_audience']:,.0f}명",
+                f"{kobis_summary['top_movie_name']}"
             ), unsafe_allow_html=True)
         else:
             st.markdown(create_metric_card("최고 흥행작", "데이터 없음"), unsafe_allow_html=True)
@@ -182,48 +327,38 @@ def show_key_metrics(kobis_df, tmdb_df):
     # 연도별 비교 차트
     col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+    with col1, st.container(border=True):
         st.subheader("📈 연도별 관객수 변화")
         
-        yearly_audience = kobis_df.groupby('year')['audiCnt'].sum().reset_index()
-        if not yearly_audience.empty:
-            fig = px.bar(yearly_audience, x='year', y='audiCnt',
-                        title="연도별 총 관객수",
-                        color='audiCnt',
-                        color_continuous_scale='Viridis')
-            fig.update_layout(
-                xaxis_title="연도",
-                yaxis_title="총 관객수 (명)",
-                showlegend=False,
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        # 연도는 작은 정수 범위이므로 해시 기반 groupby 대신 bincount로 합산
+        years = kobis_df['year'].to_numpy()
+        if years.size:
+            year_offsets = years - years.min()
+            year_totals = np.bincount(year_offsets, weights=kobis_df['audiCnt'].to_numpy())
+            year_present = np.bincount(year_offsets) > 0
+            yearly_audience = pd.DataFrame({
+                'year': np.arange(years.min(), years.max() + 1)[year_present],
+                'audiCnt': year_totals[year_present].astype(np.int64)
+            })
+            
+            st.plotly_chart(build_yearly_fig(yearly_audience), use_container_width=True)
     
-    with col2:
-        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+    with col2, st.container(border=True):
         st.subheader("🎭 월별 개봉 패턴")
         
         if 'openDt' in kobis_df.columns and not kobis_df['openDt'].isna().all():
-            kobis_df['month'] = kobis_df['openDt'].dt.month
-            monthly_releases = kobis_df.groupby('month').size().reset_index(name='count')
-            month_names = ['1월', '2월', '3월', '4월', '5월', '6월', 
-                          '7월', '8월', '9월', '10월', '11월', '12월']
-            monthly_releases['month_name'] = monthly_releases['month'].map(
-                {i+1: month_names[i] for i in range(12)}
-            )
+            # month 0(개봉일 없음)은 bincount 결과의 첫 칸이므로 잘라냄
+            month_counts = np.bincount(kobis_df['month'].to_numpy(), minlength=13)[1:]
+            month_names = np.asarray(['1월', '2월', '3월', '4월', '5월', '6월', 
+                                      '7월', '8월', '9월', '10월', '11월', '12월'])
+            monthly_releases = pd.DataFrame({
+                'month': np.arange(1, 13),
+                'count': month_counts,
+                'month_name': month_names
+            })
+            monthly_releases = monthly_releases[monthly_releases['count'] > 0]
             
-            fig = px.line(monthly_releases, x='month_name', y='count',
-                         title="월별 영화 개봉 수",
-                         markers=True)
-            fig.update_layout(
-                xaxis_title="월",
-                yaxis_title="개봉 영화 수",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+            st.plotly_chart(build_monthly_fig(monthly_releases), use_container_width=True)
 
 def show_korean_analysis(kobis_df):
     st.header("🇰🇷 한국 박스오피스 심층 분석")
@@ -237,66 +372,48 @@ def show_korean_analysis(kobis_df):
     
     with col1:
         st.subheader("🏆 흥행 순위 TOP 10")
-        top_movies = kobis_df.nlargest(10, 'audiAcc')[['movieNm', 'audiAcc', 'openDt', 'year']].copy()
+        top_movies = top_n_rows(kobis_df, 'audiAcc')[['movieNm', 'audiAcc', 'year']].copy()
         top_movies['순위'] = range(1, len(top_movies) + 1)
-        top_movies['누적관객수'] = top_movies['audiAcc'].apply(lambda x: f"{x:,}명")
-        top_movies['개봉년도'] = top_movies['year'].astype(int)
         
-        display_df = top_movies[['순위', 'movieNm', '누적관객수', '개봉년도']].copy()
+        # 숫자 컬럼은 그대로 두고 표시 형식만 지정
+        display_df = top_movies[['순위', 'movieNm', 'audiAcc', 'year']].copy()
         display_df.columns = ['순위', '영화명', '누적관객수', '개봉년도']
-        st.dataframe(display_df, use_container_width=True, hide_index=True)
+        st.dataframe(display_df.style.format({'누적관객수': '{:,}명'}),
+                     use_container_width=True, hide_index=True)
     
     with col2:
         st.subheader("📊 관객수 분포")
         audience_ranges = ['10만 미만', '10만-100만', '100만-500만', '500만-1000만', '1000만 이상']
-        audience_counts = [
-            len(kobis_df[kobis_df['audiAcc'] < 100000]),
-            len(kobis_df[(kobis_df['audiAcc'] >= 100000) & (kobis_df['audiAcc'] < 1000000)]),
-            len(kobis_df[(kobis_df['audiAcc'] >= 1000000) & (kobis_df['audiAcc'] < 5000000)]),
-            len(kobis_df[(kobis_df['audiAcc'] >= 5000000) & (kobis_df['audiAcc'] < 10000000)]),
-            len(kobis_df[kobis_df['audiAcc'] >= 10000000])
-        ]
+        audience_bins = [-np.inf, 100000, 1000000, 5000000, 10000000, np.inf]
+        audience_counts = pd.cut(
+            kobis_df['audiAcc'], bins=audience_bins, labels=audience_ranges, right=False
+        ).value_counts(sort=False).reindex(audience_ranges).values
         
-        fig = px.pie(values=audience_counts, names=audience_ranges,
-                    title="관객수별 영화 분포")
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_audience_pie(audience_counts, audience_ranges), use_container_width=True)
     
     # 장르 분석
     if 'genres' in kobis_df.columns and not kobis_df['genres'].isna().all():
         st.subheader("🎭 장르별 성과 분석")
         
-        # 장르 데이터 처리
-        genre_data = []
-        for _, row in kobis_df.iterrows():
-            if pd.notna(row['genres']):
-                genres = str(row['genres']).split(',')
-                for genre in genres:
-                    genre = genre.strip()
-                    if genre:  # 빈 문자열 제외
-                        genre_data.append({
-                            'genre': genre,
-                            'audiCnt': row['audiCnt'] if pd.notna(row['audiCnt']) else 0,
-                            'salesAmt': row['salesAmt'] if pd.notna(row['salesAmt']) else 0
-                        })
+        # 장르 데이터 처리 (쉼표로 구분된 장르를 행 단위로 분해)
+        genre_df = kobis_df[['audiCnt', 'salesAmt', 'genres']].dropna(subset=['genres'])
+        genre_df = genre_df.fillna({'audiCnt': 0, 'salesAmt': 0})
+        genre_df = genre_df.assign(genre=genre_df['genres'].str.split(',')).explode('genre')
+        genre_df['genre'] = genre_df['genre'].str.strip()
+        genre_df = genre_df[genre_df['genre'] != '']  # 빈 문자열 제외
         
-        if genre_data:
-            genre_df = pd.DataFrame(genre_data)
-            genre_summary = genre_df.groupby('genre').agg({
-                'audiCnt': ['sum', 'mean', 'count'],
-                'salesAmt': 'sum'
-            }).round(0)
+        if not genre_df.empty:
+            genre_summary = genre_df.groupby('genre', sort=False).agg(
+                총관객수=('audiCnt', 'sum'),
+                평균관객수=('audiCnt', 'mean'),
+                영화수=('audiCnt', 'count'),
+                총매출=('salesAmt', 'sum')
+            ).round(0)
             
-            genre_summary.columns = ['총관객수', '평균관객수', '영화수', '총매출']
             genre_summary = genre_summary.sort_values('총관객수', ascending=False).head(8)
             genre_summary = genre_summary.reset_index()
             
-            fig = px.bar(genre_summary, x='genre', y='총관객수',
-                        title="장르별 총 관객수",
-                        color='총관객수',
-                        color_continuous_scale='Reds')
-            fig.update_layout(xaxis_title="장르", yaxis_title="총 관객수")
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_genre_fig(genre_summary), use_container_width=True)
 
 def show_global_analysis(tmdb_df):
     st.header("🌍 글로벌 영화 트렌드")
@@ -309,31 +426,29 @@ def show_global_analysis(tmdb_df):
     
     with col1:
         st.subheader("⭐ 평점 TOP 10")
-        top_rated = tmdb_df.nlargest(10, 'vote_average')[['title', 'vote_average', 'vote_count', 'year']].copy()
+        top_rated = top_n_rows(tmdb_df, 'vote_average')[['title', 'vote_average', 'vote_count', 'year']].copy()
         top_rated['순위'] = range(1, len(top_rated) + 1)
-        top_rated['평점'] = top_rated['vote_average'].round(1)
-        top_rated['투표수'] = top_rated['vote_count'].apply(lambda x: f"{x:,}")
         
-        display_df = top_rated[['순위', 'title', '평점', '투표수']].copy()
+        display_df = top_rated[['순위', 'title', 'vote_average', 'vote_count']].copy()
         display_df.columns = ['순위', '영화명', '평점', '투표수']
-        st.dataframe(display_df, use_container_width=True, hide_index=True)
+        st.dataframe(display_df.style.format({'평점': '{:.1f}', '투표수': '{:,}'}),
+                     use_container_width=True, hide_index=True)
     
     with col2:
         st.subheader("🔥 인기도 TOP 10")
-        top_popular = tmdb_df.nlargest(10, 'popularity')[['title', 'popularity', 'vote_average', 'year']].copy()
+        top_popular = top_n_rows(tmdb_df, 'popularity')[['title', 'popularity', 'vote_average', 'year']].copy()
         top_popular['순위'] = range(1, len(top_popular) + 1)
-        top_popular['인기도'] = top_popular['popularity'].round(1)
-        top_popular['평점'] = top_popular['vote_average'].round(1)
         
-        display_df = top_popular[['순위', 'title', '인기도', '평점']].copy()
+        display_df = top_popular[['순위', 'title', 'popularity', 'vote_average']].copy()
         display_df.columns = ['순위', '영화명', '인기도', '평점']
-        st.dataframe(display_df, use_container_width=True, hide_index=True)
+        st.dataframe(display_df.style.format({'인기도': '{:.1f}', '평점': '{:.1f}'}),
+                     use_container_width=True, hide_index=True)
     
     # 언어별 분석
     if 'original_language' in tmdb_df.columns:
         st.subheader("🌐 언어별 영화 분포")
         
-        lang_analysis = tmdb_df.groupby('original_language').agg({
+        lang_analysis = tmdb_df.groupby('original_language', observed=True).agg({
             'title': 'count',
             'vote_average': 'mean',
             'popularity': 'mean'
@@ -341,13 +456,9 @@ def show_global_analysis(tmdb_df):
         lang_analysis.columns = ['언어', '영화수', '평균평점', '평균인기도']
         lang_analysis = lang_analysis.sort_values('영화수', ascending=False).head(10)
         
-        fig = px.bar(lang_analysis, x='언어', y='영화수',
-                    title="언어별 영화 제작 수",
-                    color='평균평점',
-                    color_continuous_scale='Blues')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_language_fig(lang_analysis), use_container_width=True)
 
-def show_insights(kobis_df, tmdb_df):
+def show_insights(kobis_df, tmdb_df, kobis_summary, tmdb_summary):
     st.header("💡 데이터 인사이트 리포트")
     
     # 인사이트 박스들
@@ -355,8 +466,8 @@ def show_insights(kobis_df, tmdb_df):
     
     if not kobis_df.empty:
         # 한국 영화 인사이트
-        total_movies = len(kobis_df)
-        blockbuster_count = len(kobis_df[kobis_df['audiAcc'] >= 10000000])
+        total_movies = kobis_summary['count']
+        blockbuster_count = int((kobis_df['audiAcc'].to_numpy() >= 10000000).sum())
         blockbuster_rate = (blockbuster_count / total_movies * 100) if total_movies > 0 else 0
         
         insights.append({
@@ -367,9 +478,9 @@ def show_insights(kobis_df, tmdb_df):
         
         # 계절성 분석
         if 'openDt' in kobis_df.columns and not kobis_df['openDt'].isna().all():
-            kobis_df['month'] = kobis_df['openDt'].dt.month
-            summer_movies = len(kobis_df[kobis_df['month'].isin([6, 7, 8])])
-            total_with_date = len(kobis_df.dropna(subset=['openDt']))
+            months = kobis_df['month'].to_numpy()
+            summer_movies = int(((months >= 6) & (months <= 8)).sum())
+            total_with_date = int((months > 0).sum())
             summer_rate = (summer_movies / total_with_date * 100) if total_with_date > 0 else 0
             
             insights.append({
@@ -380,8 +491,8 @@ def show_insights(kobis_df, tmdb_df):
     
     if not tmdb_df.empty:
         # 글로벌 트렌드
-        high_rated = len(tmdb_df[tmdb_df['vote_average'] >= 8.0])
-        total_tmdb = len(tmdb_df)
+        high_rated = tmdb_summary['high_rated_count']
+        total_tmdb = tmdb_summary['count']
         quality_rate = (high_rated / total_tmdb * 100) if total_tmdb > 0 else 0
         
         insights.append({
@@ -391,8 +502,8 @@ def show_insights(kobis_df, tmdb_df):
         })
         
         # 언어 다양성
-        if 'original_language' in tmdb_df.columns:
-            unique_languages = tmdb_df['original_language'].nunique()
+        if 'language_count' in tmdb_summary:
+            unique_languages = tmdb_summary['language_count']
             insights.append({
                 "title": "🌍 언어 다양성 확산",
                 "content": f"글로벌 차트에 **{unique_languages}개 언어**의 영화가 등장했습니다. "
@@ -417,20 +528,20 @@ def show_insights(kobis_df, tmdb_df):
     with col1:
         st.markdown("**🇰🇷 한국 영화 데이터**")
         if not kobis_df.empty:
-            st.write(f"• 총 영화 수: **{len(kobis_df):,}편**")
-            st.write(f"• 분석 기간: **{kobis_df['year'].min():.0f} - {kobis_df['year'].max():.0f}년**")
-            st.write(f"• 총 누적 관객: **{kobis_df['audiAcc'].sum():,.0f}명**")
-            st.write(f"• 평균 상영관: **{kobis_df['scrnCnt'].mean():.0f}개**")
+            st.write(f"• 총 영화 수: **{kobis_summary['count']:,}편**")
+            st.write(f"• 분석 기간: **{kobis_summary['year_min']:.0f} - {kobis_summary['year_max']:.0f}년**")
+            st.write(f"• 총 누적 관객: **{kobis_summary['total_audience']:,.0f}명**")
+            st.write(f"• 평균 상영관: **{kobis_summary['avg_screen']:.0f}개**")
         else:
             st.write("데이터 없음")
     
     with col2:
         st.markdown("**🌍 글로벌 영화 데이터**")
         if not tmdb_df.empty:
-            st.write(f"• 총 영화 수: **{len(tmdb_df):,}편**")
-            st.write(f"• 분석 기간: **{tmdb_df['year'].min():.0f} - {tmdb_df['year'].max():.0f}년**")
-            st.write(f"• 평균 평점: **{tmdb_df['vote_average'].mean():.1f}/10**")
-            st.write(f"• 평균 인기도: **{tmdb_df['popularity'].mean():.1f}**")
+            st.write(f"• 총 영화 수: **{tmdb_summary['count']:,}편**")
+            st.write(f"• 분석 기간: **{tmdb_summary['year_min']:.0f} - {tmdb_summary['year_max']:.0f}년**")
+            st.write(f"• 평균 평점: **{tmdb_summary['avg_rating']:.1f}/10**")
+            st.write(f"• 평균 인기도: **{tmdb_summary['avg_popularity']:.1f}**")
         else:
             st.write("데이터 없음")
 